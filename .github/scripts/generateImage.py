@@ -1,8 +1,14 @@
+import hashlib
 import json
 import os
+import sys
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 
 # Resolve paths relative to repo root regardless of working directory
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -10,6 +16,20 @@ _REPO_ROOT = os.path.abspath(os.path.join(_SCRIPT_DIR, "..", ".."))
 
 MODS_FILE = os.path.join(_REPO_ROOT, "mods.json")
 OUTPUT_FILE = os.path.join(_REPO_ROOT, "mod_stack_preview.png")
+# Hash of the inputs that produced OUTPUT_FILE, committed alongside it
+SIGNATURE_FILE = OUTPUT_FILE + ".sha"
+# Resized banners persisted between workflow runs (restored via actions/cache)
+BANNER_CACHE_DIR = os.path.join(_REPO_ROOT, ".banner_cache")
+
+HTTP_TIMEOUT = (3.05, 10)  # (connect, read) seconds per banner download
+
+# Banners come from a handful of CDNs, so reuse connections and back off on 429/5xx
+session = requests.Session()
+_retry = Retry(total=3, connect=3, read=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+               allowed_methods=("GET", "HEAD"), respect_retry_after_header=True, raise_on_status=False)
+_adapter = HTTPAdapter(max_retries=_retry, pool_connections=16, pool_maxsize=16)
+session.mount("https://", _adapter)
+session.mount("http://", _adapter)
 
 # Load mod data - filter only highlights for the banner
 with open(MODS_FILE, "r", encoding="utf-8") as f:
@@ -22,47 +42,125 @@ output_height = 256
 image_size = 256  # Square images
 images = []
 
+# Skip all work if the highlighted banners (and this script) are unchanged since the last render
+signature = hashlib.sha256()
+with open(os.path.abspath(__file__), "rb") as f:
+    signature.update(f.read())
+signature.update(json.dumps([mod.get("banner") for mod in mods]).encode("utf-8"))
+signature = signature.hexdigest()
+
+if os.path.exists(OUTPUT_FILE) and os.path.exists(SIGNATURE_FILE):
+    with open(SIGNATURE_FILE, "r", encoding="utf-8") as f:
+        if f.read().strip() == signature:
+            print(f"Banners unchanged, keeping {OUTPUT_FILE}")
+            sys.exit(0)
+
 # Load and resize banners
-for mod in mods:
+def banner_cache_path(url):
+    """Cache file for a banner URL at the current image size."""
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(BANNER_CACHE_DIR, f"{digest}_{image_size}.png")
+
+def fetch(mod):
+    """Download and resize a single banner. Returns (mod, image) or (mod, None) on failure."""
     url = mod.get("banner")
     if not url:
-        continue
+        return mod, None
+    cache_path = banner_cache_path(url)
+    if os.path.exists(cache_path):
+        try:
+            cached = Image.open(cache_path)
+            cached.load()
+            return mod, cached
+        except Exception as e:
+            print(f"Ignoring unreadable cached banner for {mod['name']}: {e}")
     try:
-        r = requests.get(url, timeout=10)
-        img = Image.open(BytesIO(r.content)).convert("RGBA")
+        r = session.get(url, timeout=HTTP_TIMEOUT)
+        r.raise_for_status()
+        img = Image.open(BytesIO(r.content))
+        # Let libjpeg decode at a reduced scale (no-op for non-JPEG banners)
+        img.draft("RGB", (image_size, image_size))
+        # Most banners are opaque JPEGs: keep them 3-channel so the resize touches
+        # 25% less data, and only carry alpha when the source actually has it
+        has_alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+        target_mode = "RGBA" if has_alpha else "RGB"
+        if img.mode != target_mode:
+            img = img.convert(target_mode)
         # Resize to square, maintaining aspect ratio and cropping
-        resized = img.resize((image_size, image_size), Image.LANCZOS)
-        images.append(resized)
+        # reducing_gap box-reduces large sources first so Lanczos runs on a small buffer
+        resized = img.resize((image_size, image_size), Image.LANCZOS, reducing_gap=3.0)
+        resized.save(cache_path, "PNG")
+        return mod, resized
     except Exception as e:
         print(f"Failed to load {mod['name']}: {e}")
+        return mod, None
+
+os.makedirs(BANNER_CACHE_DIR, exist_ok=True)
+
+# Downloads are network-bound, so fetch them concurrently (map keeps mods order)
+if mods:
+    with ThreadPoolExecutor(max_workers=min(32, len(mods))) as executor:
+        results = list(executor.map(fetch, mods))
+    images = [resized for _, resized in results if resized is not None]
+
+# Drop cached banners no current highlight uses so the cache doesn't grow forever
+in_use = {os.path.basename(banner_cache_path(mod["banner"])) for mod in mods if mod.get("banner")}
+for name in os.listdir(BANNER_CACHE_DIR):
+    if name not in in_use:
+        os.remove(os.path.join(BANNER_CACHE_DIR, name))
 
 if not images:
     print("No images to combine.")
     exit()
 
-# Create canvas with title area at top
-output = Image.new("RGBA", (output_width, output_height), (0, 0, 0, 0))
 num_images = len(images)
 
 # Calculate overlap-based positions (right images overlap more)
-positions = []
 if num_images == 1:
     positions = [0]
 else:
-    easing = [((i / (num_images - 1)) ** 1.5) for i in range(num_images)]
-    max_eased = easing[-1]
-    eased_spread = [(1 - (e / max_eased)) for e in easing]  # inverse
-    total_spread = sum(eased_spread)
-    scale = (output_width - image_size) / total_spread
-    x = 0
-    for spread in eased_spread:
-        positions.append(int(x))
-        x += spread * scale
-
-# Paste images back-to-front so leftmost is least covered
-for i in range(num_images - 1, -1, -1):
-    output.paste(images[i], (positions[i], 0), images[i])
+    eased = (np.arange(num_images, dtype=np.float64) / (num_images - 1)) ** 1.5
+    eased_spread = 1 - eased / eased[-1]  # inverse
+    scale = (output_width - image_size) / eased_spread.sum()
+    offsets = np.concatenate(([0.0], np.cumsum(eased_spread[:-1] * scale)))
+    # Small epsilon absorbs float error so the last tile lands flush right
+    positions = np.floor(offsets + 1e-9).astype(int).tolist()
+
+def to_rgba_array(img):
+    """RGB/RGBA image -> uint16 RGBA array (opaque RGB tiles get a solid alpha channel)."""
+    arr = np.asarray(img, dtype=np.uint16)
+    if img.mode == "RGB":
+        return np.dstack((arr, np.full(arr.shape[:2], 255, dtype=np.uint16)))
+    return arr
+
+def composite(tiles, positions, height, width):
+    """
+    Stack tiles back-to-front (leftmost ends up least covered), matching
+    Image.paste(tile, pos, tile): every channel, alpha included, is blended with
+    the tile's alpha as mask: out = (src * a + dst * (255 - a)) / 255, rounded like PIL
+    """
+    canvas = np.zeros((height, width, 4), dtype=np.uint16)
+    for tile, x in zip(reversed(tiles), reversed(positions)):
+        h = min(tile.shape[0], height)
+        w = min(tile.shape[1], width - x)
+        src = tile[:h, :w]
+        region = canvas[:h, x:x + w]
+        mask = src[..., 3:4]
+        blended = src * mask + region * (255 - mask) + 128
+        region[:] = ((blended >> 8) + blended) >> 8
+    return canvas
+
+# Convert each tile once, then composite them in a single pass
+tiles = [to_rgba_array(img) for img in images]
+output = Image.fromarray(composite(tiles, positions, output_height, output_width).astype(np.uint8))
 
 # Save output
 output.save(OUTPUT_FILE)
 print(f"Saved: {OUTPUT_FILE} (with {num_images} highlighted mods)")
+
+# Only record the signature when every banner made it in, so failures get retried next run
+if num_images == sum(1 for mod in mods if mod.get("banner")):
+    with open(SIGNATURE_FILE, "w", encoding="utf-8") as f:
+        f.write(signature + "\n")
+elif os.path.exists(SIGNATURE_FILE):
+    os.remove(SIGNATURE_FILE)
@@ -7,7 +7,11 @@ Runs via GitHub Action, caches issues as JSON files
 import json
 import os
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import ConnectTimeoutError, ReadTimeoutError
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 
 # Resolve paths relative to repo root regardless of working directory
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -17,6 +21,13 @@ MODS_FILE = os.path.join(_REPO_ROOT, "mods.json")
 CACHE_DIR = os.path.join(_REPO_ROOT, "issues", "cache")
 CACHE_FILE = os.path.join(CACHE_DIR, "issues_cache.json")
 
+GRAPHQL_URL = "https://api.github.com/graphql"
+GRAPHQL_BATCH_SIZE = 25  # repository aliases per GraphQL query
+MAX_WORKERS = 8  # concurrent GitHub requests
+
+# One UTC timestamp shared by every cache entry written this run
+RUN_TIMESTAMP = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
 # Read mods.json to get all repos
 with open(MODS_FILE, 'r') as f:
     mods = json.load(f)
@@ -30,90 +41,276 @@ headers = {
 if GITHUB_TOKEN:
     headers['Authorization'] = f'token {GITHUB_TOKEN}'
 
+# (connect, read) seconds; a batched GraphQL query needs longer to answer than a REST page
+HTTP_TIMEOUT = (3.05, 10)
+GRAPHQL_TIMEOUT = (3.05, 30)
+
+# Every request goes to api.github.com, so one pooled session serves both the REST and GraphQL paths
+session = requests.Session()
+_retry = Retry(total=3, connect=3, read=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+               allowed_methods=("GET", "HEAD"), respect_retry_after_header=True, raise_on_status=False)
+_adapter = HTTPAdapter(max_retries=_retry, pool_connections=16, pool_maxsize=16)
+session.mount("https://", _adapter)
+session.mount("http://", _adapter)
+
 # Create issues cache directory
 os.makedirs(CACHE_DIR, exist_ok=True)
 
-issues_cache = {}
+# Previous run's cache, used for conditional requests
+previous_cache = {}
+if os.path.exists(CACHE_FILE):
+    try:
+        with open(CACHE_FILE, 'r') as f:
+            previous_cache = json.load(f)
+    except Exception as e:
+        print(f"Could not load previous cache: {e}")
+
+
+def is_pinned(issue):
+    if not issue.get('labels'):
+        return False
+    pinned_labels = ['pinned', 'announcement', 'important', 'sticky']
+    return any(label['name'].lower() in pinned_labels for label in issue['labels'])
+
+
+def simplify_issues(issues):
+    """Sort pinned issues first, keep the top 10 and strip them to the fields the site uses"""
+    issues = sorted(issues, key=lambda x: (not is_pinned(x), -int(datetime.fromisoformat(x['created_at'].replace('Z', '+00:00')).timestamp())))
+
+    # Keep top 10
+    issues = issues[:10]
+
+    # Simplify data (only keep what we need)
+    simplified_issues = []
+    for issue in issues:
+        simplified_issues.append({
+            'number': issue['number'],
+            'title': issue['title'],
+            'html_url': issue['html_url'],
+            'created_at': issue['created_at'],
+            'user': {
+                'login': issue['user']['login']
+            },
+            'labels': [
+                {
+                    'name': label['name'],
+                    'color': label['color']
+                }
+                for label in issue.get('labels', [])
+            ][:3]  # Only keep first 3 labels
+        })
+    return simplified_issues
+
+
+def cache_entry(simplified_issues, error=None, etag=None):
+    entry = {
+        'issues': simplified_issues,
+        'timestamp': RUN_TIMESTAMP
+    }
+    if etag:
+        entry['etag'] = etag
+    if error is not None:
+        entry['error'] = error
+    return entry
+
+
+def is_timeout(error):
+    """
+    True for timeouts, including ones that used up the session's retries: urllib3 then
+    raises MaxRetryError, which requests surfaces as ConnectionError rather than Timeout
+    """
+    if isinstance(error, requests.exceptions.Timeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        return isinstance(getattr(error.args[0], 'reason', None), (ConnectTimeoutError, ReadTimeoutError))
+    return False
+
+
+def stale_entry(cache_key, error):
+    """On a timeout keep last run's issues rather than blanking the repo; error entry if there are none"""
+    previous = previous_cache.get(cache_key)
+    if previous and 'error' not in previous:
+        return previous
+    return cache_entry([], error)
+
+
+def fetch_issues_rest(owner, repo, etag=None):
+    """
+    Fetch open issues for one repo via the REST API (used when no token is available)
+    Returns (issues, etag); issues is None when GitHub answered 304 Not Modified
+    """
+    url = f"https://api.github.com/repos/{owner}/{repo}/issues"
+    params = {
+        'state': 'open',
+        'sort': 'created',
+        'direction': 'desc',
+        'per_page': 30
+    }
+    request_headers = dict(headers)
+    if etag:
+        # 304 responses carry no body and don't count against the rate limit
+        request_headers['If-None-Match'] = etag
+
+    response = session.get(url, headers=request_headers, params=params, timeout=HTTP_TIMEOUT)
+    if response.status_code == 304:
+        return None, etag
+    response.raise_for_status()
+
+    # Filter out pull requests
+    return [issue for issue in response.json() if 'pull_request' not in issue], response.headers.get('ETag')
+
+
+def fetch_one_rest(key):
+    """Build the cache entry for one repo. Returns (cache_key, entry, log line)"""
+    owner, repo = key
+    cache_key = f"{owner}/{repo}"
+    previous = previous_cache.get(cache_key, {})
+    # Only revalidate entries that were fetched successfully last time
+    etag = previous.get('etag') if 'error' not in previous else None
+
+    try:
+        issues, etag = fetch_issues_rest(owner, repo, etag)
+    except Exception as e:
+        if is_timeout(e):
+            return cache_key, stale_entry(cache_key, str(e)), f"  ✗ Timeout fetching {cache_key}, keeping previous issues: {e}"
+        return cache_key, cache_entry([], str(e)), f"  ✗ Error fetching {cache_key}: {e}"
+
+    if issues is None:
+        simplified_issues = previous.get('issues', [])
+        return cache_key, cache_entry(simplified_issues, etag=etag), f"  ✓ {cache_key}: {len(simplified_issues)} issues (not modified)"
+
+    simplified_issues = simplify_issues(issues)
+    return cache_key, cache_entry(simplified_issues, etag=etag), f"  ✓ {cache_key}: {len(simplified_issues)} issues"
+
+
+def build_issues_query(batch):
+    """One GraphQL query with a repository alias per (owner, repo) in the batch"""
+    blocks = []
+    for idx, (owner, repo) in enumerate(batch):
+        blocks.append(
+            f'r{idx}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)}) {{ '
+            'issues(first: 30, states: OPEN, orderBy: {field: CREATED_AT, direction: DESC}) { '
+            'nodes { number title url createdAt author { login } labels(first: 100) { nodes { name color } } } '
+            '} }'
+        )
+    return "query {\n" + "\n".join(blocks) + "\n}"
+
+
+def graphql_issue_to_rest(node):
+    """Map a GraphQL Issue node onto the REST field names simplify_issues expects"""
+    return {
+        'number': node['number'],
+        'title': node['title'],
+        'html_url': node['url'],
+        'created_at': node['createdAt'],
+        'user': {
+            'login': (node.get('author') or {}).get('login', 'ghost')
+        },
+        'labels': node['labels']['nodes']
+    }
+
+
+class GraphQLError(Exception):
+    """GraphQL answered with errors and no data (bad query, rate limit, ...)"""
+
+
+def fetch_issues_graphql(batch):
+    """
+    Fetch open issues for a batch of repos in a single GraphQL request
+    Returns dict of (owner, repo) -> (list of REST-shaped issues, None), or (None, error message)
+    for a repo GraphQL could not resolve
+    """
+    response = session.post(
+        GRAPHQL_URL,
+        json={'query': build_issues_query(batch)},
+        headers={'Authorization': f'bearer {GITHUB_TOKEN}'},
+        timeout=GRAPHQL_TIMEOUT
+    )
+    response.raise_for_status()
+    payload = response.json()
+    errors = payload.get('errors') or []
+    data = payload.get('data')
+    if data is None:
+        raise GraphQLError('; '.join(error.get('message', 'unknown error') for error in errors) or 'no data returned')
+
+    # Per-repo failures come back as a null alias plus an error whose path starts with that alias
+    alias_errors = {}
+    for error in errors:
+        path = error.get('path') or []
+        if path:
+            alias_errors.setdefault(path[0], error.get('message', 'unknown error'))
+
+    results = {}
+    for idx, key in enumerate(batch):
+        repository = data.get(f'r{idx}')
+        if repository is None:
+            results[key] = (None, alias_errors.get(f'r{idx}', 'repository not found'))
+            continue
+        # GraphQL Issue nodes never include pull requests
+        results[key] = ([graphql_issue_to_rest(node) for node in repository['issues']['nodes']], None)
+    return results
+
 
+# Collect every GitHub repo referenced by mods.json
+repos = []
 for mod in mods:
     repo_url = mod.get('repo_url', '')
     if not repo_url or 'github.com' not in repo_url:
         continue
-    
+
     # Extract owner and repo from URL
     parts = repo_url.replace('https://github.com/', '').replace('.git', '').split('/')
     if len(parts) < 2:
         continue
-    
-    owner, repo = parts[0], parts[1]
-    cache_key = f"{owner}/{repo}"
-    
-    print(f"Fetching issues for {cache_key}...")
-    
-    try:
-        # Fetch open issues
-        url = f"https://api.github.com/repos/{owner}/{repo}/issues"
-        params = {
-            'state': 'open',
-            'sort': 'created',
-            'direction': 'desc',
-            'per_page': 30
-        }
-        
-        response = requests.get(url, headers=headers, params=params, timeout=10)
-        response.raise_for_status()
-        
-        issues = response.json()
-        
-        # Filter out pull requests
-        issues = [issue for issue in issues if 'pull_request' not in issue]
-        
-        # Sort: pinned issues first
-        def is_pinned(issue):
-            if not issue.get('labels'):
-                return False
-            pinned_labels = ['pinned', 'announcement', 'important', 'sticky']
-            return any(label['name'].lower() in pinned_labels for label in issue['labels'])
-        
-        issues.sort(key=lambda x: (not is_pinned(x), -int(datetime.fromisoformat(x['created_at'].replace('Z', '+00:00')).timestamp())))
-        
-        # Keep top 10
-        issues = issues[:10]
-        
-        # Simplify data (only keep what we need)
-        simplified_issues = []
-        for issue in issues:
-            simplified_issues.append({
-                'number': issue['number'],
-                'title': issue['title'],
-                'html_url': issue['html_url'],
-                'created_at': issue['created_at'],
-                'user': {
-                    'login': issue['user']['login']
-                },
-                'labels': [
-                    {
-                        'name': label['name'],
-                        'color': label['color']
-                    }
-                    for label in issue.get('labels', [])
-                ][:3]  # Only keep first 3 labels
-            })
-        
-        issues_cache[cache_key] = {
-            'issues': simplified_issues,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
-        }
-        
-        print(f"  ✓ Found {len(simplified_issues)} issues")
-        
-    except Exception as e:
-        print(f"  ✗ Error fetching {cache_key}: {e}")
-        issues_cache[cache_key] = {
-            'issues': [],
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
-            'error': str(e)
-        }
+
+    key = (parts[0], parts[1])
+    if key not in repos:
+        repos.append(key)
+
+issues_cache = {}
+
+if GITHUB_TOKEN:
+    # GraphQL requires authentication; batch many repos into each request
+    batches = [repos[start:start + GRAPHQL_BATCH_SIZE] for start in range(0, len(repos), GRAPHQL_BATCH_SIZE)]
+    print(f"Fetching issues for {len(repos)} repos via GraphQL ({len(batches)} batches)...")
+
+    def fetch_batch(batch):
+        try:
+            return batch, fetch_issues_graphql(batch), None
+        except Exception as e:
+            return batch, None, e
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        batch_results = list(executor.map(fetch_batch, batches))
+
+    for batch, results, error in batch_results:
+        if is_timeout(error) or isinstance(error, GraphQLError):
+            print(f"  ✗ GraphQL batch failed, keeping previous issues: {error}")
+            for owner, repo in batch:
+                issues_cache[f"{owner}/{repo}"] = stale_entry(f"{owner}/{repo}", str(error))
+            continue
+        if error is not None:
+            print(f"  ✗ GraphQL batch failed: {error}")
+            for owner, repo in batch:
+                issues_cache[f"{owner}/{repo}"] = cache_entry([], str(error))
+            continue
+
+        for (owner, repo), (issues, repo_error) in results.items():
+            cache_key = f"{owner}/{repo}"
+            if issues is None:
+                print(f"  ✗ Error fetching {cache_key}: {repo_error}")
+                issues_cache[cache_key] = cache_entry([], repo_error)
+                continue
+
+            simplified_issues = simplify_issues(issues)
+            issues_cache[cache_key] = cache_entry(simplified_issues)
+            print(f"  ✓ {cache_key}: {len(simplified_issues)} issues")
+else:
+    print(f"Fetching issues for {len(repos)} repos via REST...")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for cache_key, entry, message in executor.map(fetch_one_rest, repos):
+            issues_cache[cache_key] = entry
+            print(message)
 
 # Write cache file
 with open(CACHE_FILE, 'w') as f:
@@ -1,13 +1,16 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import orjson
+import random
 import re
 import time
-from bs4 import BeautifulSoup
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from selectolax.lexbor import LexborHTMLParser
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 from threading import Lock
-from collections import deque
 
 # CONFIG
 GITHUB_USERNAME = "Chuckleberry-Finn"
@@ -20,15 +23,15 @@ _REPO_ROOT = os.path.abspath(os.path.join(_SCRIPT_DIR, "..", ".."))
 OUTPUT_FILE = os.path.join(_REPO_ROOT, "mods.json")
 QUEUE_FILE = os.path.join(_REPO_ROOT, "github_stats_queue.json")
 STEAM_RETRY_FILE = os.path.join(_REPO_ROOT, "steam_retry_queue.json")
-
-# GitHub API Rate Limiting
-GITHUB_API_LIMIT = 55  # Conservative limit (actual is 60/hour)
+STEAM_CACHE_FILE = os.path.join(_REPO_ROOT, "steam_cache.json")
+WORKSHOP_ID_CACHE_FILE = os.path.join(_REPO_ROOT, "workshop_id_cache.json")
 
 # Detect if running in GitHub Actions
 IS_GITHUB_ACTIONS = os.environ.get("GITHUB_ACTIONS") == "true"
 
 # Concurrency settings
-STEAM_MAX_WORKERS = 1  # For Steam requests (rate limited)
+STEAM_MAX_WORKERS = 4  # For Steam requests (steam_limiter still paces the actual requests)
+IO_MAX_WORKERS = 16  # For GitHub / CDN requests (not Steam rate limited)
 
 # Rate limiting - PROACTIVE from the start
 STEAM_REQUESTS_PER_MINUTE = 6   # Reduced from 9 to be gentler on Steam
@@ -41,6 +44,22 @@ STEAM_MAX_RETRY_SECONDS = 600  # 10 minutes per mod
 # Deliberate pause between each mod to avoid looking like a burst to Steam
 INTER_MOD_SLEEP = 30  # seconds
 
+# Steam scrape cache: reuse a workshop item's data without any request while it's
+# younger than STEAM_CACHE_TTL; if a live scrape fails, fall back to it up to STEAM_CACHE_MAX_AGE
+STEAM_CACHE_TTL = 6 * 60 * 60  # 6 hours (subscriber counts drift slowly)
+STEAM_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # 7 days (titles/banners rarely change)
+
+# Steam Web API: title/preview/subscriber count for many workshop items per POST, no key needed
+STEAM_API_DETAILS_URL = "https://api.steampowered.com/ISteamRemoteStorage/GetPublishedFileDetails/v1/"
+STEAM_API_BATCH_SIZE = 100
+
+# GitHub GraphQL (token required): workshop.txt of many repos per query
+GRAPHQL_URL = "https://api.github.com/graphql"
+GRAPHQL_BATCH_SIZE = 50  # repository aliases per query
+
+# One UTC timestamp for everything this run writes (queues, cache entries)
+RUN_TIMESTAMP = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
 # GitHub Actions logging helpers
 def gh_group(title):
     """Start a collapsible group in GitHub Actions"""
@@ -78,41 +97,85 @@ def gh_error(message):
         print(f"✗ {message}")
 
 class RateLimiter:
-    """Thread-safe rate limiter using sliding window"""
-    def __init__(self, max_requests, window_seconds):
+    """Thread-safe rate limiter using a token bucket (bursts up to max_requests, then refills evenly)"""
+    def __init__(self, max_requests, window_seconds, verbose=True):
         self.max_requests = max_requests
         self.window = window_seconds
-        self.requests = deque()
+        self.verbose = verbose
+        self.rate = max_requests / window_seconds  # tokens per second
+        self.tokens = float(max_requests)
+        self.last_refill = time.monotonic()
         self.lock = Lock()
     
     def acquire(self):
         """Wait until we can make a request within rate limits"""
         with self.lock:
-            now = time.time()
-            
-            # Remove requests outside the window
-            while self.requests and now - self.requests[0] >= self.window:
-                self.requests.popleft()
-            
-            # If at capacity, wait for the oldest request to age out
-            if len(self.requests) >= self.max_requests:
-                sleep_time = self.window - (now - self.requests[0]) + 0.1
-                if sleep_time > 0:
-                    if IS_GITHUB_ACTIONS:
-                        print(f"Rate limit: waiting {sleep_time:.1f}s... ({len(self.requests)}/{self.max_requests} requests in window)")
-                    else:
-                        print(f"Rate limit: waiting {sleep_time:.1f}s...")
-                    time.sleep(sleep_time)
-                    # Clean up again after sleeping
-                    now = time.time()
-                    while self.requests and now - self.requests[0] >= self.window:
-                        self.requests.popleft()
-            
-            # Record this request
-            self.requests.append(time.time())
+            now = time.monotonic()
+            self.tokens = min(self.max_requests, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+
+            # Take a token; if the bucket is empty this reserves the next one to refill,
+            # so the wait happens outside the lock and other callers queue up behind it
+            self.tokens -= 1
+            sleep_time = -self.tokens / self.rate if self.tokens < 0 else 0
+
+        if sleep_time > 0:
+            if self.verbose and IS_GITHUB_ACTIONS:
+                print(f"Rate limit: waiting {sleep_time:.1f}s... ({self.max_requests} requests per {self.window}s)")
+            elif self.verbose:
+                print(f"Rate limit: waiting {sleep_time:.1f}s...")
+            time.sleep(sleep_time)
+
+# Request headers for Steam workshop pages (English page so the stats labels match)
+STEAM_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept-Language": "en-US,en;q=0.9"
+}
+
+# Subscriber count row of the workshop stats table, e.g. <td>1,234</td><td>Current Subscribers</td>
+SUBS_RE = re.compile(r'<td[^>]*>\s*([\d,]+)\s*</td>\s*<td[^>]*>[^<]*Subscribers', re.S)
+YOUTUBE_VIDEO_RE = re.compile(r'YOUTUBE_VIDEO_ID\s*:\s*"([a-zA-Z0-9_-]{11})"')
+# Once both have arrived everything scraped from a workshop page has been read
+STEAM_PAGE_END_MARKERS = (b"Current Subscribers", b"workshopItemDescription")
+STEAM_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Last page number from a GitHub pagination Link header
+LAST_PAGE_RE = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+# Workshop ID in a highlight repo's Steam homepage URL (...filedetails/?id=123)
+HOMEPAGE_ID_RE = re.compile(r'id=(\d+)')
+# First non-empty id= line of a workshop.txt key=value file
+WORKSHOP_ID_LINE_RE = re.compile(r'^\s*id=[ \t]*(\S+)', re.M)
 
 # Global rate limiter - always active
 steam_limiter = RateLimiter(STEAM_REQUESTS_PER_MINUTE, RATE_WINDOW)
+# At most one live mod scrape per INTER_MOD_SLEEP, so cache hits don't pay the pause
+steam_mod_limiter = RateLimiter(1, INTER_MOD_SLEEP, verbose=False)
+
+# (connect, read) timeouts: fail fast on unreachable hosts, allow slow bodies
+HTTP_TIMEOUT = (3.05, 10)
+STEAM_TIMEOUT = (3.05, 15)
+GRAPHQL_TIMEOUT = (3.05, 30)
+
+def make_session(status_forcelist, headers=None, read_retries=2, status_retries=None):
+    """Pooled session; callers pick which statuses to retry and how many read/status retries to allow"""
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    retry = Retry(total=3, connect=3, read=read_retries, status=status_retries, backoff_factor=0.5,
+                  status_forcelist=status_forcelist,
+                  allowed_methods=("GET", "HEAD"), respect_retry_after_header=True, raise_on_status=False)
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=50, pool_maxsize=50)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# One pooled session per service. GitHub (API + raw) carries the token once here.
+GH_SESSION = make_session((429, 500, 502, 503, 504),
+                          {"Authorization": f"token {GITHUB_TOKEN}"} if GITHUB_TOKEN else None)
+# Steam only retries failed connects (nothing reached Steam). Status and read retries
+# would bypass steam_limiter, so get_workshop_data's rate limited loop owns those
+STEAM_SESSION = make_session((), STEAM_HEADERS, read_retries=0, status_retries=0)
 
 # ============================================================
 # QUEUE MANAGEMENT
@@ -123,29 +186,11 @@ def validate_banner_url(url):
     if not url:
         return False
     try:
-        r = requests.head(url, timeout=8, allow_redirects=True)
+        r = STEAM_SESSION.head(url, timeout=HTTP_TIMEOUT, allow_redirects=True)
         return r.status_code == 200
     except Exception:
         return False
 
-def load_existing_stats():
-    """Load existing GitHub stats from mods.json"""
-    stats_cache = {}
-    
-    if os.path.exists(OUTPUT_FILE):
-        try:
-            with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
-                existing_mods = json.load(f)
-                for mod in existing_mods:
-                    repo_url = mod.get('repo_url')
-                    github_stats = mod.get('github')
-                    if repo_url and github_stats:
-                        stats_cache[repo_url] = github_stats
-        except Exception as e:
-            gh_warning(f"Could not load existing stats: {e}")
-    
-    return stats_cache
-
 def load_existing_banners():
     """Load existing banner URLs from mods.json, validating each one.
     Returns a dict of repo_url -> banner_url for banners that are still live.
@@ -156,8 +201,8 @@ def load_existing_banners():
         return banner_cache
 
     try:
-        with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
-            existing_mods = json.load(f)
+        with open(OUTPUT_FILE, 'rb') as f:
+            existing_mods = orjson.loads(f.read())
     except Exception as e:
         gh_warning(f"Could not load existing banners: {e}")
         return banner_cache
@@ -168,47 +213,72 @@ def load_existing_banners():
 
     gh_notice(f"Validating {len(needs_validation)} existing banner URLs...")
 
-    for repo_url, banner_url in needs_validation:
-        if validate_banner_url(banner_url):
-            banner_cache[repo_url] = banner_url
-        else:
-            gh_warning(f"Stale/broken banner for {repo_url.split('/')[-1]}, will re-fetch")
+    # HEAD checks go to the image CDN, not the rate limited workshop pages, so run them concurrently
+    with ThreadPoolExecutor(max_workers=IO_MAX_WORKERS) as executor:
+        results = executor.map(validate_banner_url, [banner_url for _, banner_url in needs_validation])
+        for (repo_url, banner_url), is_valid in zip(needs_validation, results):
+            if is_valid:
+                banner_cache[repo_url] = banner_url
+            else:
+                gh_warning(f"Stale/broken banner for {repo_url.split('/')[-1]}, will re-fetch")
 
     gh_notice(f"  {len(banner_cache)}/{len(needs_validation)} banners are still valid")
     return banner_cache
 
-def load_queue():
-    """Load the queue of repos pending stats fetch"""
-    if not os.path.exists(QUEUE_FILE):
-        return [], None
-    
-    try:
-        with open(QUEUE_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            pending = data.get('pending', [])
-            timestamp = data.get('timestamp')
-            return pending, timestamp
-    except Exception as e:
-        gh_warning(f"Could not load queue: {e}")
-        return [], None
-
 def save_queue(pending_repos):
-    """Save the queue of repos that still need stats"""
+    """Save the queue file; the site shows its timestamp as the last data update"""
     queue_data = {
         'pending': pending_repos,
-        'timestamp': datetime.utcnow().isoformat() + 'Z'
+        'timestamp': RUN_TIMESTAMP
     }
     
-    with open(QUEUE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(queue_data, f, indent=2, ensure_ascii=False)
+    with open(QUEUE_FILE, 'wb') as f:
+        f.write(orjson.dumps(queue_data, option=orjson.OPT_INDENT_2))
+
+def load_steam_cache():
+    """Load cached Steam scrape results keyed by workshop ID"""
+    if not os.path.exists(STEAM_CACHE_FILE):
+        return {}
+    try:
+        with open(STEAM_CACHE_FILE, 'rb') as f:
+            return orjson.loads(f.read())
+    except Exception as e:
+        gh_warning(f"Could not load steam cache: {e}")
+        return {}
+
+def save_steam_cache(steam_cache):
+    """Save cached Steam scrape results"""
+    with open(STEAM_CACHE_FILE, 'wb') as f:
+        f.write(orjson.dumps(steam_cache, option=orjson.OPT_INDENT_2))
+
+def load_workshop_id_cache():
+    """Load cached workshop.txt lookups keyed by repo full name"""
+    if not os.path.exists(WORKSHOP_ID_CACHE_FILE):
+        return {}
+    try:
+        with open(WORKSHOP_ID_CACHE_FILE, 'rb') as f:
+            return orjson.loads(f.read())
+    except Exception as e:
+        gh_warning(f"Could not load workshop ID cache: {e}")
+        return {}
+
+def save_workshop_id_cache(workshop_id_cache):
+    """Save cached workshop.txt lookups"""
+    with open(WORKSHOP_ID_CACHE_FILE, 'wb') as f:
+        f.write(orjson.dumps(workshop_id_cache, option=orjson.OPT_INDENT_2))
+
+def steam_cache_age(entry):
+    """Seconds since a steam cache entry was fetched"""
+    fetched_at = datetime.fromisoformat(entry['fetched_at'].replace('Z', '+00:00'))
+    return (datetime.now(timezone.utc) - fetched_at).total_seconds()
 
 def load_steam_retry_queue():
     """Load steam URLs that failed to scrape (missing banner or subs) last run."""
     if not os.path.exists(STEAM_RETRY_FILE):
         return [], None
     try:
-        with open(STEAM_RETRY_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(STEAM_RETRY_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
             return data.get('pending', []), data.get('timestamp')
     except Exception as e:
         gh_warning(f"Could not load steam retry queue: {e}")
@@ -218,49 +288,10 @@ def save_steam_retry_queue(steam_urls):
     """Save steam URLs that need to be retried next run."""
     queue_data = {
         'pending': steam_urls,
-        'timestamp': datetime.utcnow().isoformat() + 'Z'
+        'timestamp': RUN_TIMESTAMP
     }
-    with open(STEAM_RETRY_FILE, 'w', encoding='utf-8') as f:
-        json.dump(queue_data, f, indent=2, ensure_ascii=False)
-
-# ============================================================
-# GITHUB API - Stats Fetching
-# ============================================================
-
-def get_github_stats(repo):
-    """
-    Fetch GitHub stats for a repository
-    Returns dict with openIssues, stars, forks
-    """
-    owner = repo.get('owner', {}).get('login', GITHUB_USERNAME)
-    name = repo.get('name')
-    
-    if not name:
-        return None
-    
-    url = f"https://api.github.com/repos/{owner}/{name}"
-    headers = {"Authorization": f"token {GITHUB_TOKEN}"} if GITHUB_TOKEN else {}
-    
-    try:
-        r = requests.get(url, headers=headers, timeout=10)
-        
-        if r.status_code == 200:
-            data = r.json()
-            return {
-                'openIssues': data.get('open_issues_count', 0),
-                'stars': data.get('stargazers_count', 0),
-                'forks': data.get('forks_count', 0)
-            }
-        elif r.status_code == 404:
-            gh_warning(f"Repo not found: {owner}/{name}")
-            return None
-        else:
-            gh_warning(f"GitHub API error for {owner}/{name}: {r.status_code}")
-            return None
-            
-    except Exception as e:
-        gh_error(f"Failed to fetch stats for {owner}/{name}: {e}")
-        return None
+    with open(STEAM_RETRY_FILE, 'wb') as f:
+        f.write(orjson.dumps(queue_data, option=orjson.OPT_INDENT_2))
 
 # ============================================================
 # GITHUB REPO FETCHING
@@ -268,24 +299,29 @@ def get_github_stats(repo):
 
 def get_repos():
     url = f"https://api.github.com/users/{GITHUB_USERNAME}/repos"
-    headers = {"Authorization": f"token {GITHUB_TOKEN}"} if GITHUB_TOKEN else {}
-    repos = []
-    page = 1
 
-    while True:
-        r = requests.get(url, headers=headers, params={
+    def fetch_page(page):
+        r = GH_SESSION.get(url, params={
             "page": page,
             "per_page": 100,
             "type": "all",
             "sort": "updated"
-        })
+        }, timeout=HTTP_TIMEOUT)
         if r.status_code != 200:
             raise Exception("GitHub API error:", r.text)
-        page_repos = r.json()
-        if not page_repos:
-            break
-        repos.extend(page_repos)
-        page += 1
+        return r
+
+    # Page 1 tells us how many pages there are via the Link header
+    first = fetch_page(1)
+    repos = first.json()
+    match = LAST_PAGE_RE.search(first.headers.get("Link", ""))
+    last_page = int(match.group(1)) if match else 1
+
+    # Fetch the remaining pages concurrently (map keeps page order)
+    if last_page > 1:
+        with ThreadPoolExecutor(max_workers=IO_MAX_WORKERS) as executor:
+            for r in executor.map(fetch_page, range(2, last_page + 1)):
+                repos.extend(r.json())
 
     return [repo for repo in repos if not repo.get("archived") and not repo.get("private")]
 
@@ -293,10 +329,13 @@ def get_repos():
 # WORKSHOP.TXT FETCHING
 # ============================================================
 
-def get_workshop_id_from_repo(repo):
+def get_workshop_id_from_repo(repo, workshop_id_cache=None):
     """
     Fetch workshop.txt from repo and extract workshop ID
     Returns (workshop_id, is_highlight, steam_url) tuple
+
+    workshop.txt lookups are remembered in workshop_id_cache (including misses)
+    and reused without any request until the repo is pushed to again
     """
     # Check if repo has homepage with Steam URL (these are highlights)
     homepage = repo.get("homepage", "")
@@ -304,78 +343,187 @@ def get_workshop_id_from_repo(repo):
     
     # If homepage has Steam URL, extract ID and use the full URL directly
     if is_highlight:
-        match = re.search(r'id=(\d+)', homepage)
+        match = HOMEPAGE_ID_RE.search(homepage)
         if match:
             return (match.group(1), True, homepage)
-    
-    # Otherwise, try to fetch workshop.txt from repo
-    raw_url = f"https://raw.githubusercontent.com/{GITHUB_USERNAME}/{repo['name']}/main/workshop.txt"
-    headers = {"Authorization": f"token {GITHUB_TOKEN}"} if GITHUB_TOKEN else {}
-    
-    try:
-        r = requests.get(raw_url, headers=headers, timeout=10)
-        if r.status_code == 200:
-            for line in r.text.split('\n'):
-                line = line.strip()
-                if line.startswith('id='):
-                    workshop_id = line.split('=', 1)[1].strip()
-                    return (workshop_id, False, None)
-    except Exception:
-        pass
-    
-    # Try master branch as fallback
-    raw_url_master = f"https://raw.githubusercontent.com/{GITHUB_USERNAME}/{repo['name']}/master/workshop.txt"
+
+    cache_key = repo.get("full_name") or repo["name"]
+    if workshop_id_cache is not None:
+        cached = workshop_id_cache.get(cache_key)
+        if cached and cached.get("pushed_at") == repo.get("pushed_at"):
+            return (cached["workshop_id"], False, None)
+
+    # Otherwise fetch workshop.txt from the repo's default branch (always present in the repo listing)
+    branch = repo.get("default_branch") or "main"
+    raw_url = f"https://raw.githubusercontent.com/{GITHUB_USERNAME}/{repo['name']}/{branch}/workshop.txt"
+    workshop_id = None
     try:
-        r = requests.get(raw_url_master, headers=headers, timeout=10)
-        if r.status_code == 200:
-            for line in r.text.split('\n'):
-                line = line.strip()
-                if line.startswith('id='):
-                    workshop_id = line.split('=', 1)[1].strip()
-                    return (workshop_id, False, None)
+        r = GH_SESSION.get(raw_url, timeout=HTTP_TIMEOUT)
     except Exception:
-        pass
-    
-    return (None, False, None)
+        return (None, False, None)  # not cached, retried next run
+
+    if r.status_code == 200:
+        match = WORKSHOP_ID_LINE_RE.search(r.text)
+        if match:
+            workshop_id = match.group(1)
+    # Only cache a definite answer (found, or no workshop.txt)
+    if workshop_id_cache is not None and r.status_code in (200, 404):
+        workshop_id_cache[cache_key] = {
+            "pushed_at": repo.get("pushed_at"),
+            "workshop_id": workshop_id
+        }
+
+    return (workshop_id, False, None)
+
+def build_workshop_txt_query(batch):
+    """One GraphQL query reading workshop.txt on the default branch (HEAD) of each repo in the batch"""
+    blocks = []
+    for idx, repo in enumerate(batch):
+        owner = repo.get("owner", {}).get("login", GITHUB_USERNAME)
+        blocks.append(
+            f'r{idx}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo["name"])}) {{ '
+            'object(expression: "HEAD:workshop.txt") { ... on Blob { text } } }'
+        )
+    return "query {\n" + "\n".join(blocks) + "\n}"
+
+def prefetch_workshop_ids(repos, workshop_id_cache):
+    """
+    Fill workshop_id_cache for every repo pushed since its last lookup using batched
+    GraphQL queries, so get_workshop_id_from_repo needs no per-repo raw fetch.
+    Repos a batch couldn't resolve are left for the raw.githubusercontent fallback
+    """
+    stale = [repo for repo in repos
+             if workshop_id_cache.get(repo.get("full_name") or repo["name"], {}).get("pushed_at") != repo.get("pushed_at")]
+    if not GITHUB_TOKEN or not stale:
+        return 0
+
+    def fetch_batch(batch):
+        try:
+            r = GH_SESSION.post(GRAPHQL_URL, json={"query": build_workshop_txt_query(batch)}, timeout=GRAPHQL_TIMEOUT)
+            r.raise_for_status()
+            return batch, r.json().get("data") or {}
+        except Exception as e:
+            gh_warning(f"GraphQL workshop.txt batch failed, falling back to raw fetches: {e}")
+            return batch, {}
+
+    batches = [stale[start:start + GRAPHQL_BATCH_SIZE] for start in range(0, len(stale), GRAPHQL_BATCH_SIZE)]
+    resolved = 0
+    with ThreadPoolExecutor(max_workers=IO_MAX_WORKERS) as executor:
+        for batch, data in executor.map(fetch_batch, batches):
+            for idx, repo in enumerate(batch):
+                repository = data.get(f"r{idx}")
+                if repository is None:
+                    continue
+                # object is null when the default branch has no workshop.txt
+                blob = repository.get("object") or {}
+                match = WORKSHOP_ID_LINE_RE.search(blob.get("text") or "")
+                workshop_id_cache[repo.get("full_name") or repo["name"]] = {
+                    "pushed_at": repo.get("pushed_at"),
+                    "workshop_id": match.group(1) if match else None
+                }
+                resolved += 1
+    return resolved
 
 # ============================================================
 # STEAM WORKSHOP SCRAPING
 # ============================================================
 
-def get_workshop_title(soup):
-    title_div = soup.find("div", class_="workshopItemTitle")
+def get_workshop_title(tree):
+    title_div = tree.css_first("div.workshopItemTitle")
     if title_div:
-        return title_div.text.strip()
+        return title_div.text().strip()
     return None
 
-def get_workshop_image(soup):
-    img = soup.find("img", {"id": "previewImageMain"})
-    if img and img.get("src"):
-        return img["src"]
+def get_workshop_image(tree):
+    img = tree.css_first("img#previewImageMain")
+    if img and img.attributes.get("src"):
+        return img.attributes["src"]
     return None
 
-def extract_youtube_videos(steam_url):
-    try:
-        r = requests.get(steam_url, timeout=10)
-        soup = BeautifulSoup(r.text, "html.parser")
-        video_ids = set()
-        for script in soup.find_all("script"):
-            if not script.string:
-                continue
-            matches = re.findall(r'YOUTUBE_VIDEO_ID\s*:\s*"([a-zA-Z0-9_-]{11})"', script.string)
-            for vid in matches:
-                video_ids.add(f"https://www.youtube.com/watch?v={vid}")
-        return list(video_ids)
-    except Exception:
-        return []
+def extract_youtube_videos(html):
+    """YouTube links embedded in a workshop page, read straight from its raw HTML"""
+    video_ids = dict.fromkeys(YOUTUBE_VIDEO_RE.findall(html))
+    return [f"https://www.youtube.com/watch?v={vid}" for vid in video_ids]
+
+def parse_workshop_page(html):
+    """
+    Extract (sub_count, title, image, video_links) from a workshop page
+    Pure CPU work, kept apart from the fetch/retry loop in get_workshop_data
+    """
+    # selectolax/lexbor is a C parser, much faster than html.parser
+    tree = LexborHTMLParser(html)
+
+    # Subscriber count comes straight from the raw HTML, no table walk needed
+    match = SUBS_RE.search(html)
+    sub_count = match.group(1).replace(",", "") if match else "?"
+
+    title = get_workshop_title(tree)
+    image = get_workshop_image(tree)
+    video_links = extract_youtube_videos(html)
 
-def get_workshop_data(steam_url):
+    return sub_count, title, image, video_links
+
+def get_published_file_details(workshop_ids):
+    """
+    Batch-fetch workshop metadata from the Steam Web API, STEAM_API_BATCH_SIZE items per request
+    Returns dict of workshop_id -> (sub_count, title, image); items the API can't resolve are left out
+    """
+    details = {}
+    for start in range(0, len(workshop_ids), STEAM_API_BATCH_SIZE):
+        batch = workshop_ids[start:start + STEAM_API_BATCH_SIZE]
+        data = {"itemcount": len(batch)}
+        for idx, workshop_id in enumerate(batch):
+            data[f"publishedfileids[{idx}]"] = workshop_id
+        try:
+            r = STEAM_SESSION.post(STEAM_API_DETAILS_URL, data=data, timeout=STEAM_TIMEOUT)
+            r.raise_for_status()
+            items = r.json().get("response", {}).get("publishedfiledetails", [])
+        except Exception as e:
+            gh_warning(f"Steam API details request failed for {len(batch)} items: {e}")
+            continue
+        for item in items:
+            # result 1 is k_EResultOK; hidden/removed items come back with other codes
+            if item.get("result") != 1 or not item.get("title"):
+                continue
+            details[str(item["publishedfileid"])] = (
+                str(item.get("subscriptions", "?")),
+                item["title"].strip(),
+                item.get("preview_url") or None
+            )
+    return details
+
+def read_workshop_page(r):
+    """
+    Read a streamed workshop page only as far as parse_workshop_page needs: the title,
+    preview images/videos and stats table all come before the description, so the
+    description, comments and footer are never downloaded. Reads the whole page if
+    the markers never show up
+    """
+    buf = bytearray()
+    try:
+        for chunk in r.iter_content(STEAM_STREAM_CHUNK_SIZE):
+            buf += chunk
+            if all(marker in buf for marker in STEAM_PAGE_END_MARKERS):
+                break
+    finally:
+        r.close()
+    return buf.decode(r.encoding or "utf-8", errors="replace")
+
+def get_workshop_data(steam_url, cached=None):
     """Fetch workshop data with proactive rate limiting and persistent 429 backoff.
 
     On a 429 we keep retrying with exponential backoff (capped at 5 min per
     wait) until STEAM_MAX_RETRY_SECONDS have elapsed in total, then give up.
     Non-429 errors get up to 3 fast retries before giving up.
+
+    With a cached steam cache entry the request is conditional; a 304 returns the
+    cached values without a body or parse. Returns (subs, title, image, videos, validators)
     """
+    headers = {}
+    if cached and cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached and cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
     deadline = time.time() + STEAM_MAX_RETRY_SECONDS
     attempt = 0
     backoff = 30  # initial 429 backoff in seconds
@@ -385,19 +533,22 @@ def get_workshop_data(steam_url):
             # ALWAYS rate limit before making request
             steam_limiter.acquire()
 
-            headers = {
-                "User-Agent": "Mozilla/5.0",
-                "Accept-Language": "en-US,en;q=0.9"
-            }
-            r = requests.get(steam_url, headers=headers, timeout=15)
+            r = STEAM_SESSION.get(steam_url, headers=headers, stream=True, timeout=STEAM_TIMEOUT)
+            if r.status_code != 200:
+                r.close()  # error/304 bodies aren't needed
 
             if r.status_code == 429:
                 elapsed = time.time() - (deadline - STEAM_MAX_RETRY_SECONDS)
                 remaining = deadline - time.time()
-                wait = min(backoff, remaining - 1)  # never wait past deadline
+                # Prefer Steam's own Retry-After (in seconds) over our backoff, plus up to
+                # 10% jitter so retries don't line up; never wait past 5 min or the deadline
+                retry_after = r.headers.get("Retry-After", "")
+                delay = int(retry_after) if retry_after.isdigit() else backoff
+                delay = min(delay + random.uniform(0, delay * 0.1), 300)
+                wait = min(delay, remaining - 1)  # never wait past deadline
                 if wait <= 0:
                     gh_warning(f"429 and deadline reached for {steam_url}, giving up")
-                    return "?", None, None, None
+                    return "?", None, None, None, {}
                 gh_warning(
                     f"429 from Steam (attempt {attempt + 1}), "
                     f"backing off {wait:.0f}s "
@@ -408,6 +559,12 @@ def get_workshop_data(steam_url):
                 attempt += 1
                 continue
 
+            if r.status_code == 304 and headers:
+                return cached['subs'], cached['title'], cached['banner'], cached['videos'], {
+                    'etag': cached.get('etag'),
+                    'last_modified': cached.get('last_modified')
+                }
+
             if r.status_code != 200:
                 # Non-throttle errors: give up quickly (3 fast retries)
                 if attempt < 3:
@@ -415,24 +572,14 @@ def get_workshop_data(steam_url):
                     attempt += 1
                     continue
                 gh_warning(f"HTTP {r.status_code} for {steam_url} after {attempt} attempts, giving up")
-                return "?", None, None, None
+                return "?", None, None, None, {}
 
-            # Success — parse the page
-            soup = BeautifulSoup(r.text, "html.parser")
-
-            sub_count = "?"
-            for table in soup.find_all("table", class_="stats_table"):
-                for row in table.find_all("tr"):
-                    cols = row.find_all("td")
-                    if len(cols) == 2 and "Subscribers" in cols[1].text:
-                        sub_count = cols[0].text.strip().replace(",", "")
-                        break
-
-            title = get_workshop_title(soup)
-            image = get_workshop_image(soup)
-            video_links = extract_youtube_videos(steam_url)
-
-            return sub_count, title, image, video_links
+            # Success — parse the page, keeping its validators for next run's conditional request
+            validators = {
+                'etag': r.headers.get('ETag'),
+                'last_modified': r.headers.get('Last-Modified')
+            }
+            return parse_workshop_page(read_workshop_page(r)) + (validators,)
 
         except requests.exceptions.Timeout:
             if attempt < 3:
@@ -440,34 +587,113 @@ def get_workshop_data(steam_url):
                 attempt += 1
                 continue
             gh_warning(f"Timeout fetching {steam_url} after {attempt} attempts, giving up")
-            return "?", None, None, None
+            return "?", None, None, None, {}
         except Exception as e:
             if attempt < 3:
                 time.sleep(5 * (attempt + 1))
                 attempt += 1
                 continue
             gh_warning(f"Error fetching {steam_url}: {e}, giving up")
-            return "?", None, None, None
+            return "?", None, None, None, {}
 
     gh_warning(f"Deadline exceeded for {steam_url} ({STEAM_MAX_RETRY_SECONDS}s), giving up")
-    return "?", None, None, None
+    return "?", None, None, None, {}
 
 # ============================================================
 # PROCESS SINGLE MOD
 # ============================================================
 
-def process_mod(repo, is_second_pass=False, existing_banners=None):
-    """Process a single mod - used for concurrent execution"""
+def lookup_workshop_ids(repos, workshop_id_cache=None):
+    """Look up the workshop ID of every repo concurrently (GitHub only, no Steam requests)"""
+    with ThreadPoolExecutor(max_workers=IO_MAX_WORKERS) as executor:
+        return list(executor.map(lambda repo: get_workshop_id_from_repo(repo, workshop_id_cache), repos))
+
+def resolve_workshops(repos, seen_workshop_ids, workshop_id_cache=None, resolved=None):
+    """
+    Turn repos into Steam jobs, looking up workshop IDs unless already resolved
+    Returns [(repo, (workshop_id, is_highlight, steam_url))] in input order, keeping only
+    the first repo for each workshop ID not already in seen_workshop_ids
+    """
+    if resolved is None:
+        resolved = lookup_workshop_ids(repos, workshop_id_cache)
+
+    jobs = []
+    scheduled_ids = set(seen_workshop_ids)
+    for repo, (workshop_id, is_highlight, steam_url) in zip(repos, resolved):
+        if not workshop_id or workshop_id in scheduled_ids:
+            continue
+        scheduled_ids.add(workshop_id)
+        if not steam_url:
+            steam_url = f"https://steamcommunity.com/sharedfiles/filedetails/?id={workshop_id}"
+        jobs.append((repo, (workshop_id, is_highlight, steam_url)))
+    return jobs
+
+def fetch_job_details(jobs, steam_cache):
+    """Batched Steam API lookup for every resolved job whose cache entry isn't fresh and complete"""
+    stale_ids = [workshop_id for _, (workshop_id, _, _) in jobs
+                 if not steam_cache.get(workshop_id, {}).get('banner')
+                 or steam_cache_age(steam_cache[workshop_id]) >= STEAM_CACHE_TTL]
+    if not stale_ids:
+        return {}
+    details = get_published_file_details(stale_ids)
+    print(f"Steam API returned details for {len(details)}/{len(stale_ids)} workshop items")
+    return details
+
+def get_cached_workshop_data(workshop_id, steam_url, steam_cache, api_details=None, force_refresh=False):
+    """
+    get_workshop_data behind the steam cache: fresh entries skip Steam entirely,
+    complete live results are stored, and failed scrapes fall back to recent entries
+
+    When the batched API call returned this item, its subs/title refresh a cached entry
+    and the page is only scraped again (for videos) once the entry passes STEAM_CACHE_MAX_AGE.
+    Entries without a banner, and force_refresh (retry queue) items, are always re-scraped
+    """
+    cached = steam_cache.get(workshop_id)
+    age = steam_cache_age(cached) if cached else None
+    details = (api_details or {}).get(workshop_id)
+    if cached and cached.get('banner') and not force_refresh:
+        if details and age < STEAM_CACHE_MAX_AGE:
+            cached['subs'], cached['title'] = details[0], details[1]
+            cached['banner'] = cached['banner'] or details[2]
+            return cached['subs'], cached['title'], cached['banner'], cached['videos']
+        if age < STEAM_CACHE_TTL:
+            return cached['subs'], cached['title'], cached['banner'], cached['videos']
+
+    steam_mod_limiter.acquire()
+    subs_str, title, banner, video_links, validators = get_workshop_data(steam_url, cached)
+
+    if title and subs_str != "?":
+        if details:
+            # A 304 hands back the cached subs/title; this run's API result is newer
+            subs_str, title = details[0], details[1]
+            # Pages without img#previewImageMain still have the API's preview image
+            banner = banner or details[2]
+        entry = {
+            'subs': subs_str,
+            'title': title,
+            'banner': banner,
+            'videos': video_links,
+            'fetched_at': RUN_TIMESTAMP
+        }
+        entry.update({key: value for key, value in validators.items() if value})
+        steam_cache[workshop_id] = entry
+    elif details:
+        gh_warning(f"Using Steam API data for {steam_url} (page scrape failed, no videos)")
+        return details[0], details[1], details[2], []
+    elif cached and age < STEAM_CACHE_MAX_AGE:
+        gh_warning(f"Using cached Steam data for {steam_url} ({age / 3600:.1f}h old)")
+        return cached['subs'], cached['title'], cached['banner'], cached['videos']
+
+    return subs_str, title, banner, video_links
+
+def process_mod(repo, workshop, existing_banners=None, steam_cache=None, api_details=None, force_refresh=False):
+    """Scrape Steam for a single resolved mod - used for concurrent execution"""
     if existing_banners is None:
         existing_banners = {}
+    if steam_cache is None:
+        steam_cache = {}
 
-    workshop_id, is_highlight, steam_url = get_workshop_id_from_repo(repo)
-    
-    if not workshop_id:
-        return None
-    
-    if not steam_url:
-        steam_url = f"https://steamcommunity.com/sharedfiles/filedetails/?id={workshop_id}"
+    workshop_id, is_highlight, steam_url = workshop
     
     github_url = repo["html_url"]
     repo_name = repo["name"]
@@ -475,7 +701,7 @@ def process_mod(repo, is_second_pass=False, existing_banners=None):
     # If we already have a valid (validated) banner cached, skip re-fetching it
     cached_banner = existing_banners.get(github_url)
 
-    subs_str, title, banner, video_links = get_workshop_data(steam_url)
+    subs_str, title, banner, video_links = get_cached_workshop_data(workshop_id, steam_url, steam_cache, api_details, force_refresh)
 
     # Prefer freshly scraped banner; fall back to validated cache if scraping returned nothing
     resolved_banner = banner or cached_banner or ""
@@ -490,8 +716,7 @@ def process_mod(repo, is_second_pass=False, existing_banners=None):
             "banner": resolved_banner,
             "videos": video_links or [],
             "highlight": True,
-            "workshop_id": workshop_id,
-            "repo_obj": repo  # Store for GitHub stats fetching
+            "workshop_id": workshop_id
         }
         
         if subs_str != "?" and title:
@@ -513,8 +738,7 @@ def process_mod(repo, is_second_pass=False, existing_banners=None):
         "banner": resolved_banner,
         "videos": video_links or [],
         "highlight": False,
-        "workshop_id": workshop_id,
-        "repo_obj": repo  # Store for GitHub stats fetching
+        "workshop_id": workshop_id
     }
     
     if subs_str != "?":
@@ -533,25 +757,11 @@ def generate_json(repos):
     mods = []
     seen_workshop_ids = set()
     
-    # Load existing GitHub stats
-    gh_group("Loading Existing GitHub Stats")
-    existing_github_stats = load_existing_stats()
-    print(f"Found {len(existing_github_stats)} existing GitHub stats in cache")
-    gh_endgroup()
-
     # Validate existing banner URLs
     gh_group("Validating Existing Banner URLs")
     existing_banners = load_existing_banners()
     gh_endgroup()
     
-    # Load queue
-    gh_group("Loading GitHub Stats Queue")
-    pending_queue, queue_timestamp = load_queue()
-    print(f"Pending repos in queue: {len(pending_queue)}")
-    if queue_timestamp:
-        print(f"Queue last updated: {queue_timestamp}")
-    gh_endgroup()
-    
     # Load steam retry queue (last resort: mods that failed scraping previously)
     gh_group("Loading Steam Retry Queue")
     steam_retry_queue, steam_retry_timestamp = load_steam_retry_queue()
@@ -560,9 +770,26 @@ def generate_json(repos):
         print(f"Queue last updated: {steam_retry_timestamp}")
     gh_endgroup()
 
+    # Load cached Steam scrape results
+    gh_group("Loading Steam Cache")
+    steam_cache = load_steam_cache()
+    fresh = sum(1 for entry in steam_cache.values() if steam_cache_age(entry) < STEAM_CACHE_TTL)
+    print(f"Cached workshop items: {len(steam_cache)} ({fresh} fresh enough to skip Steam)")
+    gh_endgroup()
+
+    gh_group("Loading Workshop ID Cache")
+    workshop_id_cache = load_workshop_id_cache()
+    print(f"Cached workshop.txt lookups: {len(workshop_id_cache)}")
+    prefetched = prefetch_workshop_ids(repos, workshop_id_cache)
+    if prefetched:
+        print(f"Looked up {prefetched} changed repos via GraphQL")
+    gh_endgroup()
+
     # FIRST PASS: Process highlights concurrently (but rate limited)
     gh_group("FIRST PASS: Processing highlighted mods")
-    highlight_repos = [repo for repo in repos if repo.get("homepage", "") and "steamcommunity.com" in repo.get("homepage", "")]
+    highlight_urls = {repo["html_url"] for repo in repos if "steamcommunity.com" in (repo.get("homepage") or "")}
+    highlight_repos = [repo for repo in repos if repo["html_url"] in highlight_urls]
+    remaining_repos = [repo for repo in repos if repo["html_url"] not in highlight_urls]
 
     # Reorder: queued (previously failed) highlights go first as last-resort retry
     steam_retry_set = set(u.rstrip('/') for u in steam_retry_queue)
@@ -576,71 +803,81 @@ def generate_json(repos):
         for r in highlight_repos[:queued_highlight_count]:
             print(f"  • {r['name']}")
     
-    total_highlights = len(highlight_repos)
-    print(f"Found {total_highlights} highlighted repos to process")
-    print(f"Processing with {STEAM_MAX_WORKERS} concurrent workers...")
-    print(f"Rate limit: {STEAM_REQUESTS_PER_MINUTE} requests per minute\n")
-    
-    completed = 0
-    success_count = 0
-    
-    with ThreadPoolExecutor(max_workers=STEAM_MAX_WORKERS) as executor:
-        future_to_repo = {executor.submit(process_mod, repo, False, existing_banners): repo for repo in highlight_repos}
-        
-        for idx, future in enumerate(as_completed(future_to_repo), 1):
-            repo = future_to_repo[future]
-            completed += 1
-            
-            if IS_GITHUB_ACTIONS and completed % 5 == 0:
-                progress = (completed / total_highlights) * 100
-                print(f"Progress: {completed}/{total_highlights} ({progress:.1f}%)")
-            
-            print(f"[{idx}/{total_highlights}] {repo['name']}: ", end="", flush=True)
-            
-            try:
-                mod_data = future.result()
-                if mod_data and mod_data['workshop_id'] not in seen_workshop_ids:
-                    seen_workshop_ids.add(mod_data['workshop_id'])
-                    mods.append(mod_data)
-                    status = "✓" if mod_data.get('banner') and 'subs' in mod_data else "!️"
-                    success_count += 1
-                    print(status)
-                else:
-                    print("SKIP")
-            except Exception as e:
-                gh_error(f"Failed to process {repo['name']}: {e}")
-                print(f"ERROR - {e}")
-
-            # Pause between mods to avoid Steam seeing bursts
-            if idx < total_highlights:
-                time.sleep(INTER_MOD_SLEEP)
-    
-    gh_notice(f"Completed first pass: {success_count}/{total_highlights} highlights added")
-    gh_endgroup()
-    
-    # SECOND PASS: Process remaining repos
-    gh_group("SECOND PASS: Processing standard mods")
-    remaining_repos = [repo for repo in repos if repo not in highlight_repos]
+    # Resolve and dedupe workshop IDs up front so each Steam page is scraped once
+    highlight_jobs = resolve_workshops(highlight_repos, seen_workshop_ids, workshop_id_cache)
+    total_highlights = len(highlight_jobs)
+    highlight_details = fetch_job_details(highlight_jobs, steam_cache)
 
     # Reorder: previously-failed mods go first
     def remaining_sort_key(repo):
         return 0 if repo.get("html_url", "").rstrip('/') in steam_retry_set else 1
     remaining_repos = sorted(remaining_repos, key=remaining_sort_key)
-    queued_remaining_count = sum(1 for r in remaining_repos if remaining_sort_key(r) == 0)
-    if queued_remaining_count:
-        print(f"Prioritising {queued_remaining_count} previously-failed standard mods from retry queue")
 
-    print(f"Checking {len(remaining_repos)} repos for workshop.txt...")
+    # workshop.txt lookups for the second pass only hit GitHub, so run them in the
+    # background while the highlight pass waits on the Steam rate limit
+    with ThreadPoolExecutor(max_workers=1) as lookup_executor:
+        remaining_lookup = lookup_executor.submit(lookup_workshop_ids, remaining_repos, workshop_id_cache)
+        print(f"Found {len(highlight_repos)} highlighted repos, {total_highlights} unique workshop items to process")
+        print(f"Processing with {STEAM_MAX_WORKERS} concurrent workers...")
+        print(f"Rate limit: {STEAM_REQUESTS_PER_MINUTE} requests per minute\n")
+        
+        completed = 0
+        success_count = 0
+        
+        with ThreadPoolExecutor(max_workers=STEAM_MAX_WORKERS) as executor:
+            future_to_repo = {executor.submit(process_mod, repo, workshop, existing_banners, steam_cache, highlight_details,
+                                             highlight_sort_key(repo) == 0): repo for repo, workshop in highlight_jobs}
+            
+            # Collect in submission order so mods.json order doesn't depend on thread timing
+            for idx, future in enumerate(future_to_repo, 1):
+                repo = future_to_repo[future]
+                completed += 1
+                
+                if IS_GITHUB_ACTIONS and completed % 5 == 0:
+                    progress = (completed / total_highlights) * 100
+                    print(f"Progress: {completed}/{total_highlights} ({progress:.1f}%)")
+                
+                # One complete line per mod (no partial line + flush per repo)
+                prefix = f"[{idx}/{total_highlights}] {repo['name']}:"
+                
+                try:
+                    mod_data = future.result()
+                    if mod_data and mod_data['workshop_id'] not in seen_workshop_ids:
+                        seen_workshop_ids.add(mod_data['workshop_id'])
+                        mods.append(mod_data)
+                        status = "✓" if mod_data.get('banner') and 'subs' in mod_data else "!️"
+                        success_count += 1
+                        print(f"{prefix} {status}")
+                    else:
+                        print(f"{prefix} SKIP")
+                except Exception as e:
+                    print(f"{prefix} ERROR - {e}")
+                    gh_error(f"Failed to process {repo['name']}: {e}")
+
+        gh_notice(f"Completed first pass: {success_count}/{total_highlights} highlights added")
+        gh_endgroup()
+        
+        # SECOND PASS: Process remaining repos
+        gh_group("SECOND PASS: Processing standard mods")
+        queued_remaining_count = sum(1 for r in remaining_repos if remaining_sort_key(r) == 0)
+        if queued_remaining_count:
+            print(f"Prioritising {queued_remaining_count} previously-failed standard mods from retry queue")
+
+        print(f"Checking {len(remaining_repos)} repos for workshop.txt...")
+        remaining_jobs = resolve_workshops(remaining_repos, seen_workshop_ids, resolved=remaining_lookup.result())
+    print(f"Found {len(remaining_jobs)} new workshop items")
+    remaining_details = fetch_job_details(remaining_jobs, steam_cache)
     print(f"Processing with {STEAM_MAX_WORKERS} concurrent workers...\n")
     
     added = 0
     completed = 0
-    total_remaining = len(remaining_repos)
+    total_remaining = len(remaining_jobs)
     
     with ThreadPoolExecutor(max_workers=STEAM_MAX_WORKERS) as executor:
-        future_to_repo = {executor.submit(process_mod, repo, True, existing_banners): repo for repo in remaining_repos}
+        future_to_repo = {executor.submit(process_mod, repo, workshop, existing_banners, steam_cache, remaining_details,
+                                         remaining_sort_key(repo) == 0): repo for repo, workshop in remaining_jobs}
         
-        for future in as_completed(future_to_repo):
+        for future in future_to_repo:
             repo = future_to_repo[future]
             completed += 1
             
@@ -658,14 +895,16 @@ def generate_json(repos):
                     print(f"[+] {repo['name']}: {status}")
             except Exception:
                 pass
-
-            # Pause between mods to avoid Steam seeing bursts
-            if completed < total_remaining:
-                time.sleep(INTER_MOD_SLEEP)
     
     gh_notice(f"Completed second pass: {added} standard mods added")
     gh_endgroup()
 
+    # Persist Steam results for the next run, dropping workshop items no longer listed
+    save_steam_cache({wid: entry for wid, entry in steam_cache.items() if wid in seen_workshop_ids})
+    # Same for workshop.txt lookups, dropping repos that are gone
+    repo_keys = {repo.get("full_name") or repo["name"] for repo in repos}
+    save_workshop_id_cache({key: entry for key, entry in workshop_id_cache.items() if key in repo_keys})
+
     # Build steam retry queue: any mod still missing banner or subs gets queued for next run
     gh_group("Updating Steam Retry Queue")
     new_steam_retry = []
@@ -684,83 +923,8 @@ def generate_json(repos):
         gh_notice("All mods have banners and subscriber counts — steam retry queue cleared")
     gh_endgroup()
     
-    # ============================================================
-    # GITHUB STATS WITH QUEUE SYSTEM
-    # ============================================================
-    
-    gh_group("GITHUB STATS QUEUE MANAGEMENT")
-    
-    # Create repo_url to repo_obj mapping for queue processing
-    repo_map = {mod['repo_url']: mod.get('repo_obj') for mod in mods if mod.get('repo_obj')}
-    
-    # Determine which repos need stats fetched
-    repos_to_fetch = []
-    
-    # Priority 1: Process queue first (finish what we started)
-    print(f"\nProcessing queue...")
-    for repo_url in pending_queue:
-        if repo_url in repo_map:
-            repos_to_fetch.append(repo_url)
-        else:
-            gh_warning(f"Queued repo no longer exists: {repo_url}")
-    
-    print(f"  • {len(repos_to_fetch)} repos from queue")
-    
-    # Priority 2: Repos without stats at all
-    print(f"\nFinding repos without stats...")
-    repos_without_stats = []
-    for mod in mods:
-        repo_url = mod['repo_url']
-        if repo_url not in existing_github_stats and repo_url not in repos_to_fetch:
-            repos_without_stats.append(repo_url)
-    
-    print(f"  • {len(repos_without_stats)} repos need initial stats")
-    repos_to_fetch.extend(repos_without_stats[:max(0, GITHUB_API_LIMIT - len(repos_to_fetch))])
-    
-    # Limit to API limit
-    fetch_count = min(len(repos_to_fetch), GITHUB_API_LIMIT)
-    repos_to_fetch = repos_to_fetch[:fetch_count]
-    
-    print(f"\nGitHub Stats Plan:")
-    print(f"  • Will fetch: {fetch_count} repos")
-    print(f"  • Already have: {len(existing_github_stats)} repos")
-    print(f"  • Will queue: {max(0, len(pending_queue) + len(repos_without_stats) - fetch_count)} repos for next run")
-    
-    # Fetch GitHub stats for selected repos
-    if repos_to_fetch:
-        print(f"\nFetching GitHub stats for {len(repos_to_fetch)} repositories...")
-        
-        for idx, repo_url in enumerate(repos_to_fetch, 1):
-            repo_obj = repo_map.get(repo_url)
-            if not repo_obj:
-                continue
-            
-            stats = get_github_stats(repo_obj)
-            if stats:
-                existing_github_stats[repo_url] = stats
-                print(f"  ✓ [{idx}/{len(repos_to_fetch)}] {repo_obj['name']}: {stats['openIssues']} issues, {stats['stars']} stars")
-            else:
-                print(f"  ✗ [{idx}/{len(repos_to_fetch)}] {repo_obj['name']}: Failed to fetch stats")
-    
-    # Calculate what goes in the queue for next time
-    remaining_queue = []
-    
-    # Add unfetched repos from current queue
-    for repo_url in pending_queue[fetch_count:]:
-        if repo_url in repo_map:
-            remaining_queue.append(repo_url)
-    
-    # Add repos without stats that we didn't fetch this time
-    for mod in mods:
-        repo_url = mod['repo_url']
-        if repo_url not in existing_github_stats and repo_url not in repos_to_fetch and repo_url not in remaining_queue:
-            remaining_queue.append(repo_url)
-    
-    # Save queue
-    save_queue(remaining_queue)
-    print(f"\nSaved {len(remaining_queue)} repos to queue for next run")
-    
-    gh_endgroup()
+    # Stars/forks/open issues come with each repo in the get_repos listing, no per-repo requests needed
+    save_queue([])
     
     # ============================================================
     # BUILD FINAL mods.json WITH GITHUB STATS
@@ -769,23 +933,28 @@ def generate_json(repos):
     gh_group("Building final mods.json")
     
     # Add GitHub stats to mods and clean up temporary fields
+    # (repos are looked up by URL here rather than carried around inside every mod)
+    repos_by_url = {repo["html_url"]: repo for repo in repos}
     mods_with_stats = 0
     for mod in mods:
         # Remove temporary field
-        mod.pop('repo_obj', None)
         mod.pop('workshop_id', None)
         
         # Add GitHub stats if available
-        repo_url = mod['repo_url']
-        if repo_url in existing_github_stats:
-            mod['github'] = existing_github_stats[repo_url]
+        repo = repos_by_url.get(mod['repo_url'])
+        if repo:
+            mod['github'] = {
+                'openIssues': repo.get('open_issues_count', 0),
+                'stars': repo.get('stargazers_count', 0),
+                'forks': repo.get('forks_count', 0)
+            }
             mods_with_stats += 1
     
     # Sort by subs
     mods.sort(key=lambda x: x.get("subs", 0), reverse=True)
 
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(mods, f, indent=2, ensure_ascii=False)
+    with open(OUTPUT_FILE, 'wb') as f:
+        f.write(orjson.dumps(mods, option=orjson.OPT_INDENT_2))
     
     gh_endgroup()
     
@@ -796,7 +965,6 @@ def generate_json(repos):
     print(f"  • {highlights} highlights (main page)")
     print(f"  • {len(mods) - highlights} standard (issue tracker)")
     print(f"  • {mods_with_stats} with GitHub stats")
-    print(f"  • {len(remaining_queue)} queued for next run")
     print(f"{'='*60}\n")
     
     gh_notice(f"Successfully generated {OUTPUT_FILE} with {len(mods)} mods ({mods_with_stats} with GitHub stats)")